@@ -52,7 +52,7 @@ class GitAutoPuller:
     def save_config(self):
         """Save configuration to file"""
         with open(self.config_file, 'w') as f:
-            json.dump(self.config, f, indent=2)
+            f.write(json.dumps(self.config, indent=2))
 
     def is_git_repo(self):
         """Check if the current directory is a git repository"""
@@ -1,7 +1,9 @@
 import discord
 from discord.ext import commands
-import json
+import orjson
 import os
+import mmap
+import threading
 import logging
 from datetime import datetime
 import asyncio
@@ -19,21 +21,74 @@ logging.basicConfig(
 # Ensure data directory exists
 os.makedirs('data', exist_ok=True)
 
+# Parsed JSON files keyed by filename -> (st_mtime_ns, data)
+_data_cache = {}
+
+# Writes can run in worker threads and share a temp-file path per target, so take turns
+_write_lock = threading.RLock()
+
+# Files at least this many bytes are parsed straight from a memory map instead of read into a copy
+MMAP_THRESHOLD = 1024 * 1024
+
 # Load configuration
 def load_data(filename):
-    """Load data from JSON file"""
+    """Load data from JSON file, re-reading only when the file changes on disk.
+
+    The returned object is shared between callers, so anything that mutates it
+    must call save_data() afterwards. Raises ValueError if the file is not valid
+    JSON and no earlier copy is cached.
+    """
+    path = f'data/{filename}.json'
     try:
-        with open(f'data/{filename}.json', 'r') as f:
-            return json.load(f)
+        stat = os.stat(path)
     except FileNotFoundError:
+        _data_cache.pop(filename, None)
         return {}
-    except json.JSONDecodeError:
+    mtime = stat.st_mtime_ns
+
+    cached = _data_cache.get(filename)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    try:
+        with open(path, 'rb') as f:
+            if stat.st_size >= MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    data = orjson.loads(view)
+            else:
+                data = orjson.loads(f.read())
+    except FileNotFoundError:
         return {}
+    except ValueError:
+        # Invalid JSON: keep serving the last good copy. With nothing cached, raise rather than hand back
+        # an empty dict that a caller could modify and save over the real file
+        if cached:
+            return cached[1]
+        raise
+    _data_cache[filename] = (mtime, data)
+    return data
+
+def write_file_atomic(path, payload):
+    """Replace path with the payload bytes, so readers see either the old file or the new one.
+
+    Writes to a temp file and swaps it in; returns the new file's st_mtime_ns.
+    """
+    with _write_lock:
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            mtime = os.fstat(f.fileno()).st_mtime_ns
+        os.replace(tmp_path, path)
+        return mtime
 
 def save_data(filename, data):
     """Save data to JSON file"""
-    with open(f'data/{filename}.json', 'w') as f:
-        json.dump(data, f, indent=4)
+    path = f'data/{filename}.json'
+    payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    # Hold the lock across the cache update too, so the cache can't end up behind the file
+    with _write_lock:
+        _data_cache[filename] = (write_file_atomic(path, payload), data)
 
 # Bot setup
 intents = discord.Intents.default()
@@ -1,18 +1,11 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-import json
+import re
+from bot import load_data, save_data
 
-
-# Load data
-def load_data(file):
-    with open(f'data/{file}.json', 'r') as f:
-        return json.load(f)
-
-
-def save_data(file, data):
-    with open(f'data/{file}.json', 'w') as f:
-        json.dump(data, f, indent=4)
+# Six-digit hex color, with or without a leading '#'
+HEX_COLOR_RE = re.compile(r'#?([0-9a-fA-F]{6})')
 
 
 # Check if user has admin role
@@ -23,18 +16,27 @@ def is_admin(interaction):
     if not admin_roles:  # If no admin roles set, default to administrator permission
         return interaction.user.guild_permissions.administrator
 
-    for role_id in admin_roles:
-        role = interaction.guild.get_role(int(role_id))
-        if role and role in interaction.user.roles:
-            return True
+    admin_role_ids = frozenset(int(role_id) for role_id in admin_roles)
+    user_role_ids = {role.id for role in interaction.user.roles}
+    if not admin_role_ids.isdisjoint(user_role_ids):
+        return True
 
     return interaction.user.guild_permissions.administrator
 
 
+def admin_only():
+    """Only let admins run the command; denied users get a reply from cog_app_command_error"""
+    return app_commands.check(is_admin)
+
+
 class Admin(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
+    async def cog_app_command_error(self, interaction, error):
+        if isinstance(error, app_commands.CheckFailure) and not interaction.response.is_done():
+            await interaction.response.send_message("You don't have permission to use this command!", ephemeral=True)
+
     @app_commands.command(name="set_admin_role", description="Set admin roles for ticket management")
     @app_commands.describe(role="The role to add as admin")
     async def set_admin_role(self, interaction, role: discord.Role):
@@ -58,6 +60,7 @@ class Admin(commands.Cog):
         save_data('config', config)
 
     @app_commands.command(name="create_embed", description="Create a custom embed")
+    @admin_only()
     @app_commands.describe(
         channel="The channel to send the embed to",
         title="The title of the embed",
@@ -74,18 +77,12 @@ class Admin(commands.Cog):
             color: str = "#0099ff",
             image_url: str = None
     ):
-        if not is_admin(interaction):
-            await interaction.response.send_message("You don't have permission to use this command!", ephemeral=True)
-            return
-
         # Parse color
-        try:
-            if color.startswith('#'):
-                color = color[1:]
-            color_value = int(color, 16)
-        except ValueError:
+        match = HEX_COLOR_RE.fullmatch(color.strip())
+        if not match:
             await interaction.response.send_message("Invalid color format! Use hex code like #FF0000", ephemeral=True)
             return
+        color_value = int(match.group(1), 16)
 
         # Create embed
         embed = discord.Embed(
@@ -127,12 +124,9 @@ class Admin(commands.Cog):
         save_data('config', config)
 
     @app_commands.command(name="purge", description="Delete a specified number of messages")
+    @admin_only()
     @app_commands.describe(amount="The number of messages to delete (1-100)")
     async def purge(self, interaction, amount: int):
-        if not is_admin(interaction):
-            await interaction.response.send_message("You don't have permission to use this command!", ephemeral=True)
-            return
-
         if amount < 1 or amount > 100:
             await interaction.response.send_message("Please specify a number between 1 and 100!", ephemeral=True)
             return
@@ -146,6 +140,7 @@ class Admin(commands.Cog):
         await interaction.followup.send(f"Successfully deleted {len(deleted)} messages!", ephemeral=True)
 
     @app_commands.command(name="announce", description="Make an announcement in a channel")
+    @admin_only()
     @app_commands.describe(
         channel="The channel to send the announcement to",
         title="The title of the announcement",
@@ -160,10 +155,6 @@ class Admin(commands.Cog):
             message: str,
             ping_everyone: bool = False
     ):
-        if not is_admin(interaction):
-            await interaction.response.send_message("You don't have permission to use this command!", ephemeral=True)
-            return
-
         # Create embed
         embed = discord.Embed(
             title=title,
@@ -1,4 +1,5 @@
 import os
+import functools
 import discord
 from discord.ext import commands
 from discord import app_commands
@@ -29,21 +30,11 @@ class CopyrightChecker(commands.Cog):
         # Load cached data from the file (if it exists)
         self.cached_info = self.load_cache()
 
-        # YouTube API setup
-        youtube_api_key = os.getenv('YOUTUBE_API_KEY')
-        if not youtube_api_key:
+        # API clients are built on first use (see youtube_client / spotify), only warn about missing keys here
+        if not os.getenv('YOUTUBE_API_KEY'):
             logger.warning("YOUTUBE_API_KEY not found in environment variables")
-        self.youtube_client = build('youtube', 'v3', developerKey=youtube_api_key) if youtube_api_key else None
-
-        # Spotify API setup
-        spotify_client_id = os.getenv('SPOTIFY_CLIENT_ID')
-        spotify_client_secret = os.getenv('SPOTIFY_CLIENT_SECRET')
-        if not spotify_client_id or not spotify_client_secret:
+        if not os.getenv('SPOTIFY_CLIENT_ID') or not os.getenv('SPOTIFY_CLIENT_SECRET'):
             logger.warning("Spotify API credentials not found in environment variables")
-            self.spotify = None
-        else:
-            self.spotify = spotipy.Spotify(client_credentials_manager=SpotifyClientCredentials(
-                spotify_client_id, spotify_client_secret))
 
         # YouTube-DL options
         self.ydl_opts = {
@@ -55,6 +46,22 @@ class CopyrightChecker(commands.Cog):
             'cookies': 'cookies.txt' if os.path.exists('cookies.txt') else None
         }
 
+    @functools.cached_property
+    def youtube_client(self):
+        """YouTube Data API client, built the first time a command needs it"""
+        youtube_api_key = os.getenv('YOUTUBE_API_KEY')
+        return build('youtube', 'v3', developerKey=youtube_api_key) if youtube_api_key else None
+
+    @functools.cached_property
+    def spotify(self):
+        """Spotify client, built the first time a command needs it"""
+        spotify_client_id = os.getenv('SPOTIFY_CLIENT_ID')
+        spotify_client_secret = os.getenv('SPOTIFY_CLIENT_SECRET')
+        if not spotify_client_id or not spotify_client_secret:
+            return None
+        return spotipy.Spotify(client_credentials_manager=SpotifyClientCredentials(
+            spotify_client_id, spotify_client_secret))
+
     def load_cache(self):
         """Load the cached video info from a file."""
         try:
@@ -66,7 +73,7 @@ class CopyrightChecker(commands.Cog):
     def save_cache(self):
         """Save the cached video info to a file."""
         with open(self.cache_file, 'w') as f:
-            json.dump(self.cached_info, f)
+            f.write(json.dumps(self.cached_info))
 
     @app_commands.command(name='check', description="Check copyright status of a song by title or YouTube URL")
     @app_commands.describe(query="Song title or YouTube URL to check")
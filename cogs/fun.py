@@ -4,12 +4,25 @@ from discord.ext import commands
 import aiohttp
 import random
 import json
+import orjson
 from datetime import datetime
 
 
 class Fun(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        self.session = None
+
+    async def cog_load(self):
+        # One pooled session for every API command, so connections and DNS lookups are reused
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=10)
+        )
+
+    async def cog_unload(self):
+        if self.session:
+            await self.session.close()
 
     @app_commands.command(name="kiss", description="Kiss another user")
     @app_commands.describe(user="The user to kiss")
@@ -20,45 +33,43 @@ class Fun(commands.Cog):
         elif user.bot:
             await interaction.response.send_message("You can't kiss a bot!", ephemeral=True)
         else:
-            async with aiohttp.ClientSession() as session:
-                if random.randint(1,5) == 1:
-                    async with session.get('https://api.otakugifs.xyz/gif?reaction=kiss') as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            embed = discord.Embed(
-                                title=f"{interaction.user.display_name} kissed {user.display_name} 💘!",
-                                color=discord.Color.pink()
-                            )
-                            embed.set_image(url=data['url'])
-                            await interaction.response.send_message(
-                                content=f"{interaction.user.mention} {user.mention}", embed=embed)
-
-                async with session.get('https://api.otakugifs.xyz/gif?reaction=airkiss') as response:
+            if random.randint(1,5) == 1:
+                async with self.session.get('https://api.otakugifs.xyz/gif?reaction=kiss') as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = await response.json(loads=orjson.loads)
                         embed = discord.Embed(
-                            title=f"{interaction.user.display_name} kissed {user.display_name}!",
+                            title=f"{interaction.user.display_name} kissed {user.display_name} 💘!",
                             color=discord.Color.pink()
                         )
                         embed.set_image(url=data['url'])
-                        await interaction.response.send_message(content = f"{interaction.user.mention} {user.mention}", embed=embed)
+                        await interaction.response.send_message(
+                            content=f"{interaction.user.mention} {user.mention}", embed=embed)
 
-
-    @app_commands.command(name="meme", description="Get a random meme")
-    async def meme(self, interaction):
-        async with aiohttp.ClientSession() as session:
-            async with session.get('https://meme-api.com/gimme') as response:
+            async with self.session.get('https://api.otakugifs.xyz/gif?reaction=airkiss') as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await response.json(loads=orjson.loads)
                     embed = discord.Embed(
-                        title=data['title'],
-                        url=data['postLink'],
-                        color=discord.Color.random()
+                        title=f"{interaction.user.display_name} kissed {user.display_name}!",
+                        color=discord.Color.pink()
                     )
                     embed.set_image(url=data['url'])
-                    await interaction.response.send_message(embed=embed)
-                else:
-                    await interaction.response.send_message("Failed to fetch a meme. Try again later.", ephemeral=True)
+                    await interaction.response.send_message(content = f"{interaction.user.mention} {user.mention}", embed=embed)
+
+
+    @app_commands.command(name="meme", description="Get a random meme")
+    async def meme(self, interaction):
+        async with self.session.get('https://meme-api.com/gimme') as response:
+            if response.status == 200:
+                data = await response.json(loads=orjson.loads)
+                embed = discord.Embed(
+                    title=data['title'],
+                    url=data['postLink'],
+                    color=discord.Color.random()
+                )
+                embed.set_image(url=data['url'])
+                await interaction.response.send_message(embed=embed)
+            else:
+                await interaction.response.send_message("Failed to fetch a meme. Try again later.", ephemeral=True)
 
     @app_commands.command(name="8ball", description="Ask the magic 8-ball a question")
     @app_commands.describe(question="The question to ask")
@@ -125,37 +136,35 @@ class Fun(commands.Cog):
 
     @app_commands.command(name="joke", description="Get a random joke")
     async def joke(self, interaction):
-        async with aiohttp.ClientSession() as session:
-            async with session.get('https://official-joke-api.appspot.com/random_joke') as response:
-                if response.status == 200:
-                    data = await response.json()
+        async with self.session.get('https://official-joke-api.appspot.com/random_joke') as response:
+            if response.status == 200:
+                data = await response.json(loads=orjson.loads)
 
-                    embed = discord.Embed(
-                        title="😂 Random Joke",
-                        description=f"**{data['setup']}**\n\n{data['punchline']}",
-                        color=discord.Color.brand_green()
-                    )
+                embed = discord.Embed(
+                    title="😂 Random Joke",
+                    description=f"**{data['setup']}**\n\n{data['punchline']}",
+                    color=discord.Color.brand_green()
+                )
 
-                    await interaction.response.send_message(embed=embed)
-                else:
-                    await interaction.response.send_message("Failed to fetch a joke. Try again later.", ephemeral=True)
+                await interaction.response.send_message(embed=embed)
+            else:
+                await interaction.response.send_message("Failed to fetch a joke. Try again later.", ephemeral=True)
 
     @app_commands.command(name="fact", description="Get a random fact")
     async def fact(self, interaction):
-        async with aiohttp.ClientSession() as session:
-            async with session.get('https://uselessfacts.jsph.pl/random.json?language=en') as response:
-                if response.status == 200:
-                    data = await response.json()
-
-                    embed = discord.Embed(
-                        title="🧠 Random Fact",
-                        description=data['text'],
-                        color=discord.Color.blue()
-                    )
-
-                    await interaction.response.send_message(embed=embed)
-                else:
-                    await interaction.response.send_message("Failed to fetch a fact. Try again later.", ephemeral=True)
+        async with self.session.get('https://uselessfacts.jsph.pl/random.json?language=en') as response:
+            if response.status == 200:
+                data = await response.json(loads=orjson.loads)
+
+                embed = discord.Embed(
+                    title="🧠 Random Fact",
+                    description=data['text'],
+                    color=discord.Color.blue()
+                )
+
+                await interaction.response.send_message(embed=embed)
+            else:
+                await interaction.response.send_message("Failed to fetch a fact. Try again later.", ephemeral=True)
 
     @app_commands.command(name="choose", description="Let the bot choose between multiple options")
     @app_commands.describe(options="Options separated by commas")
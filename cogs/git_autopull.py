@@ -49,7 +49,7 @@ class GitAutoPullCog(commands.Cog):
         try:
             self.config_file.parent.mkdir(exist_ok=True)
             with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+                f.write(json.dumps(self.config, indent=2))
         except Exception as e:
             logging.error(f"Failed to save config: {e}")
 
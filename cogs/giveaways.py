@@ -1,21 +1,11 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-import json
 import asyncio
+import os
 import random
 from datetime import datetime, timedelta
-
-
-# Load data
-def load_data(file):
-    with open(f'data/{file}.json', 'r') as f:
-        return json.load(f)
-
-
-def save_data(file, data):
-    with open(f'data/{file}.json', 'w') as f:
-        json.dump(data, f, indent=4)
+from bot import load_data, save_data
 
 
 # Check if user has admin role
@@ -26,10 +16,10 @@ def is_admin(interaction):
     if not admin_roles:  # If no admin roles set, default to administrator permission
         return interaction.user.guild_permissions.administrator
 
-    for role_id in admin_roles:
-        role = interaction.guild.get_role(int(role_id))
-        if role and role in interaction.user.roles:
-            return True
+    admin_role_ids = frozenset(int(role_id) for role_id in admin_roles)
+    user_role_ids = {role.id for role in interaction.user.roles}
+    if not admin_role_ids.isdisjoint(user_role_ids):
+        return True
 
     return interaction.user.guild_permissions.administrator
 
@@ -169,11 +159,11 @@ class RerollButton(discord.ui.Button):
 class Giveaways(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        # on_ready fires again on every reconnect; views only need registering once
+        self._views_registered = False
 
         # Create giveaways.json if it doesn't exist
-        try:
-            load_data('giveaways')
-        except:
+        if not os.path.exists('data/giveaways.json'):
             save_data('giveaways', {})
 
         # Start giveaway checking task
@@ -191,13 +181,13 @@ class Giveaways(commands.Cog):
                 giveaways = load_data('giveaways')
                 now = datetime.now()
 
-                for giveaway_id, giveaway in list(giveaways.items()):
-                    if giveaway["status"] == "active":
-                        end_time = datetime.fromisoformat(giveaway["end_time"])
-
-                        if now >= end_time:
-                            # End the giveaway
-                            await self.end_giveaway(giveaway_id)
+                due = [
+                    giveaway_id for giveaway_id, giveaway in giveaways.items()
+                    if giveaway["status"] == "active" and now >= datetime.fromisoformat(giveaway["end_time"])
+                ]
+                if due:
+                    # End every due giveaway with one save
+                    await self.end_giveaways(due)
             except Exception as e:
                 print(f"Error checking giveaways: {e}")
 
@@ -206,31 +196,50 @@ class Giveaways(commands.Cog):
 
     @commands.Cog.listener()
     async def on_ready(self):
+        if self._views_registered:
+            return
+        self._views_registered = True
+
         # Register persistent views for active giveaways
         giveaways = load_data('giveaways')
 
-        for giveaway_id in giveaways:
-            self.bot.add_view(GiveawayView(giveaway_id))
+        for giveaway_id, giveaway in giveaways.items():
+            if giveaway.get("status") == "active":
+                self.bot.add_view(GiveawayView(giveaway_id))
 
     async def end_giveaway(self, giveaway_id):
+        await self.end_giveaways([giveaway_id])
+
+    async def end_giveaways(self, giveaway_ids):
+        """End the given giveaways, writing giveaways.json once for the whole batch, then announce each"""
         giveaways = load_data('giveaways')
-        giveaway = giveaways[giveaway_id]
+        ended_at = datetime.now().isoformat()
+        ended = []
 
-        # Mark as ended
-        giveaway["status"] = "ended"
-        giveaway["ended_at"] = datetime.now().isoformat()
+        for giveaway_id in giveaway_ids:
+            giveaway = giveaways[giveaway_id]
 
-        # Select winner(s)
-        winners = []
-        entries = giveaway["entries"]
-        winner_count = min(giveaway["winner_count"], len(entries))
+            # Mark as ended
+            giveaway["status"] = "ended"
+            giveaway["ended_at"] = ended_at
 
-        if entries and winner_count > 0:
-            winners = random.sample(entries, winner_count)
-            giveaway["winners"] = winners
+            # Select winner(s)
+            winners = []
+            entries = giveaway["entries"]
+            winner_count = min(giveaway["winner_count"], len(entries))
+
+            if entries and winner_count > 0:
+                winners = random.sample(entries, winner_count)
+                giveaway["winners"] = winners
+
+            ended.append((giveaway_id, giveaway, winners))
 
         save_data('giveaways', giveaways)
 
+        for giveaway_id, giveaway, winners in ended:
+            await self.announce_giveaway_end(giveaway_id, giveaway, winners)
+
+    async def announce_giveaway_end(self, giveaway_id, giveaway, winners):
         # Send winner announcement
         try:
             channel = self.bot.get_channel(giveaway["channel_id"])
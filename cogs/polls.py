@@ -21,6 +21,12 @@ class ReactionPollManager:
     def __init__(self, bot):
         self.bot = bot
         self.polls = {}
+        # poll_id -> {user_id: option key}, built from the votes on first use
+        self.voter_choices = {}
+        # Open polls only (poll_id -> poll) and their message IDs (message_id -> poll_id),
+        # so the close loop and reaction handler don't scan every poll ever created
+        self.active_polls = {}
+        self.active_by_message = {}
         self.load_polls()
 
     def load_polls(self):
@@ -29,10 +35,14 @@ class ReactionPollManager:
                 self.polls = json.load(f)
         except FileNotFoundError:
             self.polls = {}
+        self.active_polls = {poll_id: poll for poll_id, poll in self.polls.items() if not poll.get("closed", False)}
+        self.active_by_message = {
+            poll["message_id"]: poll_id for poll_id, poll in self.active_polls.items() if poll.get("message_id")
+        }
 
     def save_polls(self):
         with open('data/polls.json', 'w') as f:
-            json.dump(self.polls, f, indent=2)
+            f.write(json.dumps(self.polls, indent=2))
 
     def create_poll(self, question: str, options: list, duration_minutes: int, channel_id: int, author_id: int) -> str:
         poll_id = str(len(self.polls) + 1)
@@ -50,35 +60,65 @@ class ReactionPollManager:
             "closed": False,
             "type": "reaction"
         }
+        self.active_polls[poll_id] = self.polls[poll_id]
         self.save_polls()
         return poll_id
 
+    def set_message_id(self, poll_id: str, message_id: int):
+        self.polls[poll_id]["message_id"] = message_id
+        if poll_id in self.active_polls:
+            self.active_by_message[message_id] = poll_id
+        self.save_polls()
+
+    def get_active_poll_id(self, message_id: int):
+        """Return the ID of the open poll posted as message_id, or None"""
+        return self.active_by_message.get(message_id)
+
     def get_poll(self, poll_id: str) -> dict:
         return self.polls.get(poll_id)
 
+    def get_voter_choices(self, poll_id: str) -> dict:
+        choices = self.voter_choices.get(poll_id)
+        if choices is None:
+            choices = self.voter_choices[poll_id] = {
+                user: option for option, users in self.polls[poll_id]["votes"].items() for user in users
+            }
+        return choices
+
     def add_vote(self, poll_id: str, option_index: int, user_id: int):
         if poll_id not in self.polls or self.polls[poll_id]["closed"]:
             return False
         
         user_str = str(user_id)
+        option_key = str(option_index)
+        votes = self.polls[poll_id]["votes"]
+        choices = self.get_voter_choices(poll_id)
         
-        for option_votes in self.polls[poll_id]["votes"].values():
-            if user_str in option_votes:
-                option_votes.remove(user_str)
+        # Only the user's previous option needs changing, not every option's voter list
+        previous = choices.get(user_str)
+        if previous == option_key:
+            return True
+        if previous is not None:
+            votes[previous].remove(user_str)
         
-        self.polls[poll_id]["votes"][str(option_index)].append(user_str)
+        votes[option_key].append(user_str)
+        choices[user_str] = option_key
         self.save_polls()
         return True
 
     def close_poll(self, poll_id: str):
         if poll_id in self.polls:
             self.polls[poll_id]["closed"] = True
+            self.active_polls.pop(poll_id, None)
+            self.active_by_message.pop(self.polls[poll_id].get("message_id"), None)
             self.save_polls()
 
 class Polls(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.poll_manager = ReactionPollManager(bot)
+        # message_id -> in-flight fetch, shared by reactions that arrive at the same time
+        self._message_fetches = {}
         self.check_polls.start()
 
     def cog_unload(self):
@@ -89,8 +129,8 @@ class Polls(commands.Cog):
         await self.bot.wait_until_ready()
         
         now = datetime.now()
-        for poll_id, poll in list(self.poll_manager.polls.items()):
-            if not poll.get("closed", False) and poll.get("end_time"):
+        for poll_id, poll in list(self.poll_manager.active_polls.items()):
+            if poll.get("end_time"):
                 end_time = datetime.fromisoformat(poll["end_time"])
                 if now >= end_time:
                     await self.end_poll(poll_id)
@@ -248,8 +288,7 @@ class Polls(commands.Cog):
         await interaction.response.send_message(embed=embed)
         message = await interaction.original_response()
 
-        self.poll_manager.polls[poll_id]["message_id"] = message.id
-        self.poll_manager.save_polls()
+        self.poll_manager.set_message_id(poll_id, message.id)
 
         for emoji in emojis[:len(options)]:
             await message.add_reaction(emoji)
@@ -278,22 +317,25 @@ class Polls(commands.Cog):
         await self.end_poll(poll_id)
         await interaction.response.send_message("Poll ended successfully!", ephemeral=True)
 
+    async def fetch_poll_message(self, channel, message_id: int) -> discord.Message:
+        """Fetch a poll message, coalescing concurrent fetches of the same message into one request"""
+        task = self._message_fetches.get(message_id)
+        if task is None:
+            task = asyncio.create_task(channel.fetch_message(message_id))
+            self._message_fetches[message_id] = task
+            task.add_done_callback(lambda _: self._message_fetches.pop(message_id, None))
+        # Shield so one cancelled caller doesn't cancel the fetch for the others
+        return await asyncio.shield(task)
+
     @commands.Cog.listener()
     async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent):
         if payload.user_id == self.bot.user.id:
             return
 
-        poll = None
-        poll_id = None
-        
-        for pid, p in self.poll_manager.polls.items():
-            if p.get("message_id") == payload.message_id and not p.get("closed", False):
-                poll = p
-                poll_id = pid
-                break
-        
-        if not poll:
+        poll_id = self.poll_manager.get_active_poll_id(payload.message_id)
+        if poll_id is None:
             return
+        poll = self.poll_manager.get_poll(poll_id)
 
         emojis = ["👍", "👎"] if len(poll["options"]) == 2 else ["1️⃣", "2️⃣", "3️⃣", "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣", "🔟"][:len(poll["options"])]
         
@@ -304,7 +346,7 @@ class Polls(commands.Cog):
         if not channel:
             return
 
-        message = await channel.fetch_message(payload.message_id)
+        message = await self.fetch_poll_message(channel, payload.message_id)
         if not message:
             return
 
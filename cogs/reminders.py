@@ -1,20 +1,20 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-import json
+import orjson
 import asyncio
 from datetime import datetime, timedelta
 
 
 # Load data
 def load_data(file):
-    with open(f'data/{file}.json', 'r') as f:
-        return json.load(f)
+    with open(f'data/{file}.json', 'rb') as f:
+        return orjson.loads(f.read())
 
 
 def save_data(file, data):
-    with open(f'data/{file}.json', 'w') as f:
-        json.dump(data, f, indent=4)
+    with open(f'data/{file}.json', 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
 
 class Reminders(commands.Cog):  # Changed from 'Polls' to 'Reminders'
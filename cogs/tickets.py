@@ -3,21 +3,49 @@ from discord import app_commands
 from discord.ext import commands, tasks
 import traceback
 import json
-#import asyncio # Never used
+import asyncio
+from collections import Counter
+import gzip
+import heapq
+import time
 from typing import Optional, Dict, Any 
 import io
 #import re # Never used
 #import textwrap # Never used
-from datetime import datetime, timedelta
+from datetime import datetime
 import logging
 import os
 #from typing import Dict, Optional, Any, List # Duplicate
-import uuid
-from bot import load_data, save_data
+import secrets
+from bot import load_data, save_data, write_file_atomic
 
 logger = logging.getLogger('bot.tickets')
 os.makedirs('data', exist_ok=True)
 
+# Seconds to wait before writing tickets.json, so bursts of updates share one write
+SAVE_DELAY = 5
+
+# Seconds of owner inactivity before a ticket is auto-closed
+INACTIVITY_LIMIT = 24 * 60 * 60
+
+# How many tickets the auto-close task checks at the same time
+AUTO_CLOSE_CONCURRENCY = 5
+
+# Stop adding messages once a transcript reaches this many UTF-8 bytes
+TRANSCRIPT_MAX_SIZE = 7_500_000
+
+# Transcripts larger than this many bytes are uploaded gzip-compressed
+TRANSCRIPT_GZIP_THRESHOLD = 1024 * 1024
+
+def make_transcript_file(transcript: str, ticket_id: str) -> discord.File:
+    """Wrap a transcript in a discord.File, compressing it if it is large"""
+    payload = transcript.encode('utf-8')
+    filename = f"ticket-{ticket_id}-transcript.txt"
+    if len(payload) > TRANSCRIPT_GZIP_THRESHOLD:
+        payload = gzip.compress(payload, compresslevel=6)
+        filename += ".gz"
+    return discord.File(io.BytesIO(payload), filename=filename)
+
 class TicketManager:
     def __init__(self):
         self.data_file = 'data/tickets.json'
@@ -25,10 +53,18 @@ class TicketManager:
         self.lock = asyncio.Lock()
         #self.data = asyncio.run(load_data())
         self.data = None
+        self._save_task: Optional[asyncio.Task] = None
+        # Set by schedule_save, cleared when a save takes its snapshot of self.data
+        self._dirty = False
+        # Ticket counts by status and by category, kept in step with self.data['tickets']
+        self.status_counts: Counter = Counter()
+        self.category_counts: Counter = Counter()
 
     async def ensure_loaded(self):
         if self.data is None:
             self.data = await self.load_data()
+            for ticket in self.data['tickets'].values():
+                self._count(ticket, 1)
 
     async def load_data(self):
         async with self.lock:
@@ -40,16 +76,55 @@ class TicketManager:
 
     async def save_data(self):
         async with self.lock:
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, indent=2)
+            # Serialize on the event loop so the data can't change mid-dump, then write in a thread
+            self._dirty = False
+            payload = json.dumps(self.data, indent=2)
+            try:
+                await asyncio.to_thread(write_file_atomic, self.data_file, payload.encode('utf-8'))
+            except BaseException:
+                # The write may not have landed, so a later save has to cover this snapshot too
+                self._dirty = True
+                raise
+
+    def schedule_save(self):
+        """Queue a write of the ticket data, coalescing with any write already pending"""
+        self._dirty = True
+        if self._save_task is None or self._save_task.done():
+            self._save_task = asyncio.create_task(self._save_later())
+
+    async def _save_later(self):
+        await asyncio.sleep(SAVE_DELAY)
+        # Changes made while a write is in its thread don't start a new task, so save again until clean
+        while self._dirty:
+            await self.save_data()
+
+    async def flush(self):
+        """Write any pending changes immediately"""
+        task = self._save_task
+        if task and not task.done():
+            task.cancel()
+            # Let the cancellation land first; a save cut off mid-write marks the data dirty again
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if self._dirty:
+            await self.save_data()
+
+    def _count(self, ticket: dict, delta: int):
+        self.status_counts[ticket['status']] += delta
+        self.category_counts[ticket['category']] += delta
 
     def create_ticket(self, ticket_data: dict) -> str:
-        ticket_id = str(uuid.uuid4())[:8]
+        ticket_id = secrets.token_hex(4)
+        while ticket_id in self.data['tickets']:
+            ticket_id = secrets.token_hex(4)
         ticket_data['ticket_id'] = ticket_id
         ticket_data['created_at'] = datetime.now().isoformat()
         ticket_data['status'] = 'open'
         self.data['tickets'][ticket_id] = ticket_data
-        self.save_data()
+        self._count(ticket_data, 1)
+        self.schedule_save()
         return ticket_id
 
     def get_ticket(self, ticket_id: str) -> Optional[dict]:
@@ -57,18 +132,30 @@ class TicketManager:
 
     def update_ticket(self, ticket_id: str, updates: dict):
         if ticket_id in self.data['tickets']:
-            self.data['tickets'][ticket_id].update(updates)
-            self.save_data()
+            ticket = self.data['tickets'][ticket_id]
+            self._count(ticket, -1)
+            ticket.update(updates)
+            self._count(ticket, 1)
+            self.schedule_save()
 
     def delete_ticket(self, ticket_id: str):
         if ticket_id in self.data['tickets']:
-            del self.data['tickets'][ticket_id]
-            self.save_data()
+            ticket = self.data['tickets'].pop(ticket_id)
+            self._count(ticket, -1)
+            self.schedule_save()
 
     def get_user_tickets(self, user_id: int) -> list[dict]:
         return [ticket for ticket in self.data['tickets'].values() 
                 if ticket.get('user_id') == user_id]
 
+    def get_open_ticket(self, user_id: int) -> Optional[dict]:
+        """Return one of the user's open tickets, stopping at the first match"""
+        return next(
+            (ticket for ticket in self.data['tickets'].values()
+             if ticket.get('user_id') == user_id and ticket['status'] == 'open'),
+            None
+        )
+
     def get_channel_ticket(self, channel_id: int) -> Optional[dict]:
         for ticket in self.data['tickets'].values():
             if ticket.get('channel_id') == channel_id:
@@ -76,9 +163,10 @@ class TicketManager:
         return None
 
 class TicketFormModal(discord.ui.Modal):    
-    def __init__(self, category: str, *args, **kwargs):
+    def __init__(self, category: str, ticket_manager: TicketManager, *args, **kwargs):
         super().__init__(title=f"{category} - Ticket Details", *args, **kwargs)
         self.category = category
+        self.ticket_manager = ticket_manager
         self.form_data = {}
     
     async def on_submit(self, interaction: discord.Interaction):
@@ -91,7 +179,7 @@ class TicketFormModal(discord.ui.Modal):
         form_embed = self.format_embed(interaction)
         await interaction.response.defer(ephemeral=True)
         
-        ticket_view = TicketCategorySelect()
+        ticket_view = TicketCategorySelect(self.ticket_manager)
         result = await ticket_view.create_ticket_channel(interaction, self)
         
         if result:
@@ -112,8 +200,8 @@ class TicketFormModal(discord.ui.Modal):
         return embed
 
 class GeneralSupportForm(TicketFormModal):
-    def __init__(self, *args, **kwargs):
-        super().__init__("General Support", *args, **kwargs)
+    def __init__(self, ticket_manager: TicketManager, *args, **kwargs):
+        super().__init__("General Support", ticket_manager, *args, **kwargs)
         self.add_item(discord.ui.TextInput(
             label="Issue Description",
             style=discord.TextStyle.paragraph,
@@ -123,8 +211,8 @@ class GeneralSupportForm(TicketFormModal):
         ))
 
 class BugReportForm(TicketFormModal):
-    def __init__(self, *args, **kwargs):
-        super().__init__("Bug Report", *args, **kwargs)
+    def __init__(self, ticket_manager: TicketManager, *args, **kwargs):
+        super().__init__("Bug Report", ticket_manager, *args, **kwargs)
         self.add_item(discord.ui.TextInput(
             label="Bug Description",
             style=discord.TextStyle.paragraph,
@@ -148,8 +236,8 @@ class BugReportForm(TicketFormModal):
         ))
 
 class StaffApplicationForm(TicketFormModal):
-    def __init__(self, *args, **kwargs):
-        super().__init__("Staff Application", *args, **kwargs)
+    def __init__(self, ticket_manager: TicketManager, *args, **kwargs):
+        super().__init__("Staff Application", ticket_manager, *args, **kwargs)
         self.add_item(discord.ui.TextInput(
             label="Discord Username",
             style=discord.TextStyle.short,
@@ -187,8 +275,8 @@ class StaffApplicationForm(TicketFormModal):
         ))
 
 class PartnershipForm(TicketFormModal):
-    def __init__(self, *args, **kwargs):
-        super().__init__("Partnership", *args, **kwargs)
+    def __init__(self, ticket_manager: TicketManager, *args, **kwargs):
+        super().__init__("Partnership", ticket_manager, *args, **kwargs)
         self.add_item(discord.ui.TextInput(
             label="Server/Organization Name",
             style=discord.TextStyle.short,
@@ -219,9 +307,10 @@ class PartnershipForm(TicketFormModal):
         ))
 
 class CloseTicketModal(discord.ui.Modal):
-    def __init__(self, ticket_id: str, *args, **kwargs):
+    def __init__(self, ticket_id: str, ticket_manager: TicketManager, *args, **kwargs):
         super().__init__(title="Close Ticket", *args, **kwargs)
         self.ticket_id = ticket_id
+        self.ticket_manager = ticket_manager
         self.add_item(discord.ui.TextInput(
             label="Reason for closing",
             style=discord.TextStyle.paragraph,
@@ -232,8 +321,7 @@ class CloseTicketModal(discord.ui.Modal):
 
     async def on_submit(self, interaction: discord.Interaction):
         reason = self.children[0].value or "No reason provided"
-        ticket_manager = TicketManager()
-        ticket = ticket_manager.get_ticket(self.ticket_id)
+        ticket = self.ticket_manager.get_ticket(self.ticket_id)
         
         if not ticket:
             await interaction.response.send_message("Ticket not found!", ephemeral=True)
@@ -243,39 +331,63 @@ class CloseTicketModal(discord.ui.Modal):
             await interaction.response.send_message("You don't have permission to close this ticket!", ephemeral=True)
             return
 
-        await interaction.response.defer()
-        
         channel = interaction.guild.get_channel(ticket['channel_id'])
+        transcript_task = None
+        if channel:
+            # The transcript is only uploaded to the log channel, so skip
+            # fetching and encoding it when there is nowhere to send it
+            log_channel = None
+            log_channel_id = load_data('config').get('ticket_log_channel')
+            if log_channel_id:
+                log_channel = interaction.guild.get_channel(int(log_channel_id))
+            if log_channel:
+                # Start reading the channel history while the interaction is acknowledged
+                transcript_task = asyncio.create_task(self.generate_transcript(channel, ticket))
+
+        try:
+            await interaction.response.defer()
+        except Exception:
+            # Nothing will collect the transcript now, so stop reading the history
+            if transcript_task:
+                transcript_task.cancel()
+            raise
+        
+        closed_at = datetime.now()
         if channel:
             try:
-                transcript = await self.generate_transcript(channel, ticket)
-                transcript_file = discord.File(io.BytesIO(transcript.encode('utf-8')), 
-                                             filename=f"ticket-{self.ticket_id}-transcript.txt")
-                
-                log_channel_id = load_data('config').get('ticket_log_channel')
-                if log_channel_id:
-                    log_channel = interaction.guild.get_channel(int(log_channel_id))
-                    if log_channel:
-                        embed = discord.Embed(
-                            title=f"📝 Ticket Closed - {ticket['category']}",
-                            description=f"**Ticket ID:** {self.ticket_id}\n**User:** <@{ticket['user_id']}>\n**Reason:** {reason}",
-                            color=discord.Color.red(),
-                            timestamp=datetime.now()
-                        )
-                        if ticket.get('claimed_by'):
-                            embed.add_field(name="Claimed By", value=f"<@{ticket['claimed_by']}>", inline=True)
-                        await log_channel.send(embed=embed, file=transcript_file)
-
-                await channel.delete(reason=f"Ticket closed by {interaction.user}: {reason}")
+                log_send = None
+                if transcript_task:
+                    transcript = await transcript_task
+                    transcript_file = make_transcript_file(transcript, self.ticket_id)
+                    embed = discord.Embed(
+                        title=f"📝 Ticket Closed - {ticket['category']}",
+                        description=f"**Ticket ID:** {self.ticket_id}\n**User:** <@{ticket['user_id']}>\n**Reason:** {reason}",
+                        color=discord.Color.red(),
+                        timestamp=closed_at
+                    )
+                    if ticket.get('claimed_by'):
+                        embed.add_field(name="Claimed By", value=f"<@{ticket['claimed_by']}>", inline=True)
+                    log_send = log_channel.send(embed=embed, file=transcript_file)
+
+                delete = channel.delete(reason=f"Ticket closed by {interaction.user}: {reason}")
+                if log_send is None:
+                    await delete
+                else:
+                    # The transcript is already in memory, so logging it and deleting the channel can overlap
+                    log_result, delete_result = await asyncio.gather(log_send, delete, return_exceptions=True)
+                    if isinstance(log_result, Exception):
+                        logger.error(f"Error logging transcript for ticket {self.ticket_id}: {log_result}")
+                    if isinstance(delete_result, Exception):
+                        raise delete_result
                 
             except Exception as e:
                 logger.error(f"Error closing ticket {self.ticket_id}: {e}")
                 await interaction.followup.send(f"Error closing ticket: {str(e)}", ephemeral=True)
                 return
 
-        ticket_manager.update_ticket(self.ticket_id, {
+        self.ticket_manager.update_ticket(self.ticket_id, {
             'status': 'closed',
-            'closed_at': datetime.now().isoformat(),
+            'closed_at': closed_at.isoformat(),
             'closed_by': interaction.user.id,
             'close_reason': reason
         })
@@ -283,34 +395,53 @@ class CloseTicketModal(discord.ui.Modal):
         await interaction.followup.send("Ticket closed successfully!", ephemeral=True)
 
     async def generate_transcript(self, channel: discord.TextChannel, ticket: dict) -> str:
-        messages = []
+        # Header and message lines are collected in one list and joined once
+        lines = [
+            f"Ticket Transcript - {ticket['category']}",
+            f"Ticket ID: {ticket['ticket_id']}",
+            f"User: {ticket['user_name']} ({ticket['user_id']})",
+            f"Created: {ticket['created_at']}",
+            f"Status: {ticket['status']}",
+            "=" * 50,
+            ""
+        ]
+        # Formatted "Name (user)" labels, built once per distinct author
+        author_labels = {}
+        append = lines.append
+        # Encoded size of the transcript so far, counting the newline that joins each line
+        size = sum(len(line.encode('utf-8')) + 1 for line in lines)
         try:
             async for message in channel.history(limit=None, oldest_first=True):
-                timestamp = message.created_at.strftime("%Y-%m-%d %H:%M:%S")
-                author = f"{message.author.display_name} ({message.author})"
+                timestamp = message.created_at.isoformat(sep=' ', timespec='seconds')
+                author = author_labels.get(message.author.id)
+                if author is None:
+                    author = f"{message.author.display_name} ({message.author})"
+                    author_labels[message.author.id] = author
                 content = message.content or "[No text content]"
+                prefix = f"[{timestamp}] {author}: "
                 
-                messages.append(f"[{timestamp}] {author}: {content}")
+                line = prefix + content
+                append(line)
+                size += len(line.encode('utf-8')) + 1
                 
-                if message.attachments:
-                    for attachment in message.attachments:
-                        messages.append(f"[{timestamp}] {author}: [Attachment: {attachment.filename} - {attachment.url}]")
+                for attachment in message.attachments:
+                    line = f"{prefix}[Attachment: {attachment.filename} - {attachment.url}]"
+                    append(line)
+                    size += len(line.encode('utf-8')) + 1
                 
-                if message.embeds:
-                    for embed in message.embeds:
-                        messages.append(f"[{timestamp}] {author}: [Embed: {embed.title or 'No title'}]")
+                for embed in message.embeds:
+                    line = f"{prefix}[Embed: {embed.title or 'No title'}]"
+                    append(line)
+                    size += len(line.encode('utf-8')) + 1
+
+                if size > TRANSCRIPT_MAX_SIZE:
+                    append("[Transcript truncated: size limit reached]")
+                    break
         
         except Exception as e:
-            messages.append(f"[Error fetching messages: {e}]")
+            lines.append(f"[Error fetching messages: {e}]")
         
-        header = f"Ticket Transcript - {ticket['category']}\n"
-        header += f"Ticket ID: {ticket['ticket_id']}\n"
-        header += f"User: {ticket['user_name']} ({ticket['user_id']})\n"
-        header += f"Created: {ticket['created_at']}\n"
-        header += f"Status: {ticket['status']}\n"
-        header += "=" * 50 + "\n\n"
-        
-        return header + "\n".join(messages)
+        return "\n".join(lines)
 
  
 
@@ -321,6 +452,7 @@ class TicketCategorySelect(discord.ui.View):
 
     @discord.ui.select(
         placeholder="Select a ticket category...",
+        custom_id="ticket_category_select",
         options=[
             discord.SelectOption(
                 label="General Support",
@@ -351,26 +483,25 @@ class TicketCategorySelect(discord.ui.View):
     async def select_callback(self, interaction: discord.Interaction, select: discord.ui.Select):
         category = select.values[0]
         
-        user_tickets = self.ticket_manager.get_user_tickets(interaction.user.id)
-        active_tickets = [t for t in user_tickets if t['status'] == 'open']
+        active_ticket = self.ticket_manager.get_open_ticket(interaction.user.id)
         
-        if active_tickets:
+        if active_ticket:
             embed = discord.Embed(
                 title="❌ Active Ticket Found",
-                description=f"You already have an open ticket: **{active_tickets[0]['category']}**",
+                description=f"You already have an open ticket: **{active_ticket['category']}**",
                 color=discord.Color.red()
             )
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
         if category == "general":
-            await interaction.response.send_modal(GeneralSupportForm())
+            await interaction.response.send_modal(GeneralSupportForm(self.ticket_manager))
         elif category == "bug":
-            await interaction.response.send_modal(BugReportForm())
+            await interaction.response.send_modal(BugReportForm(self.ticket_manager))
         elif category == "staff":
-            await interaction.response.send_modal(StaffApplicationForm())
+            await interaction.response.send_modal(StaffApplicationForm(self.ticket_manager))
         elif category == "partnership":
-            await interaction.response.send_modal(PartnershipForm())
+            await interaction.response.send_modal(PartnershipForm(self.ticket_manager))
 
     async def create_ticket_channel(self, interaction: discord.Interaction, modal: TicketFormModal) -> tuple:
         config = load_data('config')
@@ -432,12 +563,19 @@ class TicketCategorySelect(discord.ui.View):
             embed.add_field(name="Priority", value="🟡 Normal", inline=True)
             
             view = TicketControlView(ticket_id, self.ticket_manager)
-            message = await channel.send(
-                content=f"{interaction.user.mention} " + (f"<@&{support_role_id}>" if support_role_id else ""),
-                embed=embed,
-                view=view
-            )
-            
+            try:
+                await channel.send(
+                    content=f"{interaction.user.mention} " + (f"<@&{support_role_id}>" if support_role_id else ""),
+                    embed=embed,
+                    view=view
+                )
+            except discord.HTTPException:
+                # Don't leave an open ticket behind without its control message
+                self.ticket_manager.delete_ticket(ticket_id)
+                await channel.delete(reason="Ticket setup failed")
+                raise
+
+            # Only confirm once the ticket message is actually in place
             await interaction.followup.send(
                 f"✅ Your ticket has been created: {channel.mention}",
                 ephemeral=True
@@ -483,16 +621,19 @@ class TicketControlView(discord.ui.View):
         
         channel = interaction.guild.get_channel(ticket['channel_id'])
         if channel:
-            await channel.edit(topic=f"Claimed by {interaction.user.display_name}")
+            # Channel edits are heavily rate limited, so don't spend one on a no-op
+            topic = f"Claimed by {interaction.user.display_name}"
+            if channel.topic != topic:
+                await channel.edit(topic=topic)
 
     @discord.ui.button(label="Add User", style=discord.ButtonStyle.green, emoji="➕", row=0)
     async def add_user_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        await interaction.response.send_modal(AddUserModal(self.ticket_id))
+        await interaction.response.send_modal(AddUserModal(self.ticket_id, self.ticket_manager))
 
     @discord.ui.button(label="Priority", style=discord.ButtonStyle.gray, emoji="⚡", row=0)
     async def priority_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         view = discord.ui.View()
-        view.add_item(PrioritySelect(self.ticket_id))
+        view.add_item(PrioritySelect(self.ticket_id, self.ticket_manager))
         await interaction.response.send_message("Select priority:", view=view, ephemeral=True)
 
     @discord.ui.button(label="Transcript", style=discord.ButtonStyle.secondary, emoji="📝", row=1)
@@ -511,11 +652,8 @@ class TicketControlView(discord.ui.View):
             
         channel = interaction.guild.get_channel(ticket['channel_id'])
         if channel:
-            transcript = await CloseTicketModal(self.ticket_id).generate_transcript(channel, ticket)
-            transcript_file = discord.File(
-                io.BytesIO(transcript.encode('utf-8')), 
-                filename=f"ticket-{self.ticket_id}-transcript.txt"
-            )
+            transcript = await CloseTicketModal(self.ticket_id, self.ticket_manager).generate_transcript(channel, ticket)
+            transcript_file = make_transcript_file(transcript, self.ticket_id)
             await interaction.response.send_message(
                 "Here is the transcript:", 
                 file=transcript_file, 
@@ -524,13 +662,13 @@ class TicketControlView(discord.ui.View):
 
     @discord.ui.button(label="Close", style=discord.ButtonStyle.danger, emoji="🔒", row=1)
     async def close_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        await interaction.response.send_modal(CloseTicketModal(self.ticket_id))
+        await interaction.response.send_modal(CloseTicketModal(self.ticket_id, self.ticket_manager))
 
 class AddUserModal(discord.ui.Modal):
-    def __init__(self, ticket_id: str, *args, **kwargs):
+    def __init__(self, ticket_id: str, ticket_manager: TicketManager, *args, **kwargs):
         super().__init__(title="Add User to Ticket", *args, **kwargs)
         self.ticket_id = ticket_id
-        self.ticket_manager = TicketManager()
+        self.ticket_manager = ticket_manager
         
         self.add_item(discord.ui.TextInput(
             label="User Mention or ID",
@@ -585,33 +723,35 @@ class AddUserModal(discord.ui.Modal):
         except Exception as e:
             await interaction.response.send_message(f"Error adding user: {str(e)}", ephemeral=True)
 
+PRIORITY_EMOJIS = {
+    'urgent': '🔴',
+    'high': '🟠',
+    'normal': '🟡',
+    'low': '🔵'
+}
+
+# Built once; each PrioritySelect gets its own copy of the list
+PRIORITY_OPTIONS = [
+    discord.SelectOption(label="Urgent", value="urgent", emoji="🔴"),
+    discord.SelectOption(label="High", value="high", emoji="🟠"),
+    discord.SelectOption(label="Normal", value="normal", emoji="🟡"),
+    discord.SelectOption(label="Low", value="low", emoji="🔵")
+]
+
 class PrioritySelect(discord.ui.Select):
-    def __init__(self, ticket_id: str):
+    def __init__(self, ticket_id: str, ticket_manager: TicketManager):
         self.ticket_id = ticket_id
-        self.ticket_manager = TicketManager()
+        self.ticket_manager = ticket_manager
         
-        options = [
-            discord.SelectOption(label="Urgent", value="urgent", emoji="🔴"),
-            discord.SelectOption(label="High", value="high", emoji="🟠"),
-            discord.SelectOption(label="Normal", value="normal", emoji="🟡"),
-            discord.SelectOption(label="Low", value="low", emoji="🔵")
-        ]
-        super().__init__(placeholder="Choose priority...", min_values=1, max_values=1, options=options)
+        super().__init__(placeholder="Choose priority...", min_values=1, max_values=1, options=list(PRIORITY_OPTIONS))
 
     async def callback(self, interaction: discord.Interaction):
         priority = self.values[0]
         self.ticket_manager.update_ticket(self.ticket_id, {'priority': priority})
         
-        priority_emojis = {
-            'urgent': '🔴',
-            'high': '🟠', 
-            'normal': '🟡',
-            'low': '🔵'
-        }
-        
         embed = discord.Embed(
             title="✅ Priority Updated",
-            description=f"Priority set to {priority_emojis[priority]} {priority.capitalize()}",
+            description=f"Priority set to {PRIORITY_EMOJIS[priority]} {priority.capitalize()}",
             color=discord.Color.blue()
         )
         await interaction.response.edit_message(embed=embed, view=None)
@@ -620,21 +760,37 @@ class Tickets(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.ticket_manager = TicketManager()
+        # Min-heap of (deadline timestamp, ticket_id) for open tickets awaiting an inactivity check
+        self._deadlines: list[tuple[float, str]] = []
+        self._scheduled: set[str] = set()
+        self._panel_embed = self._build_panel_embed()
+        # One persistent view serves every panel, including ones posted before a restart
+        self.panel_view = TicketCategorySelect(self.ticket_manager)
+        self.bot.add_view(self.panel_view)
         try:
             self.auto_close_task.start()
         except Exception as e:
             logger.error(f"Failed to start auto-close task: {e}")
             traceback.print_exc()
 
-    def cog_unload(self):
+    async def cog_load(self):
+        await self.ticket_manager.ensure_loaded()
+
+    async def cog_unload(self):
         try:
             self.auto_close_task.cancel()
-        except:
-            pass
+        except Exception as e:
+            logger.error(f"Failed to cancel auto-close task: {e}")
+        await self.ticket_manager.flush()
 
     @app_commands.command(name="ticketpanel", description="Create a ticket creation panel")
     @app_commands.checks.has_permissions(manage_channels=True)
     async def ticket_panel(self, interaction: discord.Interaction):
+        await interaction.response.send_message(embed=self._panel_embed, view=self.panel_view)
+
+    @staticmethod
+    def _build_panel_embed() -> discord.Embed:
+        """Build the ticket panel embed, which is the same on every invocation"""
         embed = discord.Embed(
             title="🎫 Create a Ticket",
             description="Select a category below to create a new ticket",
@@ -648,23 +804,17 @@ class Tickets(commands.Cog):
                   "🤝 **Partnership** - Partnership inquiries",
             inline=False
         )
-        
-        view = TicketCategorySelect(self.ticket_manager)
-        await interaction.response.send_message(embed=embed, view=view)
+        return embed
 
     @app_commands.command(name="tickets", description="View ticket statistics")
     @app_commands.checks.has_permissions(manage_channels=True)
     async def ticket_stats(self, interaction: discord.Interaction):
-        tickets = self.ticket_manager.data['tickets']
-        
-        total = len(tickets)
-        open_tickets = len([t for t in tickets.values() if t['status'] == 'open'])
-        closed_tickets = len([t for t in tickets.values() if t['status'] == 'closed'])
-        
-        category_counts = {}
-        for ticket in tickets.values():
-            cat = ticket['category']
-            category_counts[cat] = category_counts.get(cat, 0) + 1
+        total = len(self.ticket_manager.data['tickets'])
+        status_counts = self.ticket_manager.status_counts
+        # Drop categories whose tickets have all been deleted
+        category_counts = +self.ticket_manager.category_counts
+        open_tickets = status_counts['open']
+        closed_tickets = status_counts['closed']
         
         embed = discord.Embed(
             title="📊 Ticket Statistics",
@@ -684,55 +834,77 @@ class Tickets(commands.Cog):
     async def auto_close_task(self):
         """Auto-close tickets with 24h user inactivity"""
         await self.bot.wait_until_ready()
+        await self.ticket_manager.ensure_loaded()
         
-        # Create a copy to avoid modification during iteration
-        tickets = list(self.ticket_manager.data['tickets'].values())
-        for ticket in tickets:
-            if ticket['status'] != 'open':
-                continue
-                
-            channel = self.bot.get_channel(ticket['channel_id'])
-            if not channel:
-                continue
-                
+        now = time.time()
+        tickets = self.ticket_manager.data['tickets']
+
+        # Tickets seen for the first time get checked once to find their deadline
+        due = [
+            (ticket_id, ticket) for ticket_id, ticket in tickets.items()
+            if ticket['status'] == 'open' and ticket_id not in self._scheduled
+        ]
+
+        # After that, only tickets whose deadline has passed need their history read again
+        while self._deadlines and self._deadlines[0][0] <= now:
+            _, ticket_id = heapq.heappop(self._deadlines)
+            self._scheduled.discard(ticket_id)
+            ticket = tickets.get(ticket_id)
+            if ticket and ticket['status'] == 'open':
+                due.append((ticket_id, ticket))
+
+        # Check tickets concurrently, but only a few at a time to stay inside Discord's rate limits
+        semaphore = asyncio.Semaphore(AUTO_CLOSE_CONCURRENCY)
+
+        async def check(ticket_id, ticket):
+            async with semaphore:
+                await self._check_inactive(ticket_id, ticket, now)
+
+        await asyncio.gather(*(check(ticket_id, ticket) for ticket_id, ticket in due), return_exceptions=True)
+
+    async def _check_inactive(self, ticket_id: str, ticket: dict, now: float):
+        """Close the ticket if its owner has been inactive too long, otherwise schedule the next check"""
+        channel = self.bot.get_channel(ticket['channel_id'])
+        if not channel:
+            return
+            
+        try:
+            # Get last user message
+            last_user_msg = None
+            async for msg in channel.history(limit=100):
+                if msg.author.id == ticket['user_id'] and not msg.author.bot:
+                    last_user_msg = msg
+                    break
+            
+            # Auto-close if no user activity for 24h
+            if last_user_msg:
+                deadline = last_user_msg.created_at.timestamp() + INACTIVITY_LIMIT
+                if deadline > now:
+                    heapq.heappush(self._deadlines, (deadline, ticket_id))
+                    self._scheduled.add(ticket_id)
+                    return
+                delete_reason = "Auto-closed due to 24h user inactivity"
+                close_reason = 'Auto-closed: 24h user inactivity'
+            else:
+                # No user messages at all, close immediately
+                delete_reason = close_reason = 'Auto-closed: no user messages'
+
+            # Stamped per ticket, since the sweep checks tickets a few at a time
+            closed_at = datetime.now().isoformat()
             try:
-                # Get last user message
-                last_user_msg = None
-                async for msg in channel.history(limit=100):
-                    if msg.author.id == ticket['user_id'] and not msg.author.bot:
-                        last_user_msg = msg
-                        break
+                await channel.delete(reason=delete_reason)
+            except discord.NotFound:
+                pass  # Channel already deleted
+            self.ticket_manager.update_ticket(ticket_id, {
+                'status': 'closed',
+                'closed_at': closed_at,
+                'closed_by': None,
+                'close_reason': close_reason
+            })
                 
-                # Auto-close if no user activity for 24h
-                if last_user_msg:
-                    time_diff = datetime.now() - last_user_msg.created_at
-                    if time_diff > timedelta(hours=24):
-                        try:
-                            await channel.delete(reason="Auto-closed due to 24h user inactivity")
-                        except discord.NotFound:
-                            pass  # Channel already deleted
-                        self.ticket_manager.update_ticket(ticket['ticket_id'], {
-                            'status': 'closed',
-                            'closed_at': datetime.now().isoformat(),
-                            'closed_by': None,
-                            'close_reason': 'Auto-closed: 24h user inactivity'
-                        })
-                else:
-                    # No user messages at all, close immediately
-                    try:
-                        await channel.delete(reason="Auto-closed: no user messages")
-                    except discord.NotFound:
-                        pass  # Channel already deleted
-                    self.ticket_manager.update_ticket(ticket['ticket_id'], {
-                        'status': 'closed',
-                        'closed_at': datetime.now().isoformat(),
-                        'closed_by': None,
-                        'close_reason': 'Auto-closed: no user messages'
-                    })
-                    
-            except Exception as e:
-                logger.error(f"Error processing ticket {ticket['ticket_id']}: {e}")
-                traceback.print_exc()
+        except Exception as e:
+            logger.error(f"Error processing ticket {ticket_id}: {e}")
+            traceback.print_exc()
 
     @commands.Cog.listener()
     async def on_ready(self):
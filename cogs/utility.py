@@ -1,7 +1,7 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-import json
+import orjson
 import os
 import logging
 from datetime import datetime
@@ -11,7 +11,12 @@ import platform
 import psutil
 import asyncio
 import re
+import ast
 import math
+import operator
+import functools
+from typing import Literal, Optional
+from bot import load_data, write_file_atomic
 
 # Set up logging
 logger = logging.getLogger('bot.utility')
@@ -60,28 +65,142 @@ DEFAULT_RATES = {
 def load_rates():
     """Load exchange rates from file or use defaults if file doesn't exist"""
     try:
-        with open(RATES_FILE, 'r') as f:
-            rates = json.load(f)
+        with open(RATES_FILE, 'rb') as f:
+            rates = orjson.loads(f.read())
             # Check if rates are empty or corrupted
             if not rates or not isinstance(rates, dict):
                 return DEFAULT_RATES
             return rates
-    except (FileNotFoundError, json.JSONDecodeError):
+    except (FileNotFoundError, orjson.JSONDecodeError):
         # Save default rates to file
-        with open(RATES_FILE, 'w') as f:
-            json.dump(DEFAULT_RATES, f, indent=4)
+        write_file_atomic(RATES_FILE, orjson.dumps(DEFAULT_RATES, option=orjson.OPT_INDENT_2))
         return DEFAULT_RATES
 
-def save_rates(rates):
-    """Save exchange rates to file"""
-    with open(RATES_FILE, 'w') as f:
-        json.dump(rates, f, indent=4)
+async def save_rates(rates, previous=None):
+    """Save exchange rates to file without blocking the event loop.
+
+    Returns the serialized rates; pass them back as previous to skip rewriting an unchanged file.
+    """
+    # Serialize here so the rates can't change mid-dump, then write in a thread
+    payload = orjson.dumps(rates, option=orjson.OPT_INDENT_2)
+    if payload != previous:
+        await asyncio.to_thread(write_file_atomic, RATES_FILE, payload)
+    return payload
+
+# Seconds /stats reuses its guild, user and channel totals before recounting
+STATS_CACHE_TTL = 30
+
+# Seconds /stats reuses its CPU and memory readings
+SYSTEM_STATS_TTL = 5
+
+# ASCII bytes stripped from /calculate input before parsing; non-ASCII is dropped when encoding
+CALCULATE_ALLOWED = b'0123456789+-*/().%^ '
+CALCULATE_DELETE = bytes(b for b in range(128) if b not in CALCULATE_ALLOWED)
+
+# Dice notation accepted by /roll, e.g. 2d6
+DICE_RE = re.compile(r'^(\d+)d(\d+)$')
+
+# Operators allowed in /calculate expressions
+_BINARY_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+_UNARY_OPERATORS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+# Limits that keep /calculate cheap, since it runs on the event loop: the longest accepted
+# expression, the largest exponent, and the largest integer (in bits) any step may produce;
+# 3000 bits is about 900 digits, which still fits in an embed field
+MAX_EXPRESSION_LENGTH = 200
+MAX_EXPONENT = 100
+MAX_RESULT_BITS = 3000
+
+@functools.lru_cache(maxsize=256)
+def parse_expression(expression):
+    """Parse an arithmetic expression once; repeated expressions reuse the tree"""
+    if len(expression) > MAX_EXPRESSION_LENGTH:
+        raise ValueError(f"Expression is too long (max {MAX_EXPRESSION_LENGTH} characters)")
+    return ast.parse(expression, mode='eval').body
+
+def evaluate_expression(node):
+    """Evaluate a parsed arithmetic expression, allowing only numbers and basic operators"""
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+        left = evaluate_expression(node.left)
+        right = evaluate_expression(node.right)
+        if isinstance(node.op, ast.Pow):
+            if abs(right) > MAX_EXPONENT:
+                raise ValueError(f"Exponent is too large (max {MAX_EXPONENT})")
+            # Nested powers like ((9^99)^99)^99 grow without bound, so check the result size before computing it
+            if right > 0 and abs(left) > 1 and right * math.log2(abs(left)) > MAX_RESULT_BITS:
+                raise ValueError("Result is too large")
+        result = _BINARY_OPERATORS[type(node.op)](left, right)
+        if isinstance(result, int) and result.bit_length() > MAX_RESULT_BITS:
+            raise ValueError("Result is too large")
+        return result
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPERATORS:
+        return _UNARY_OPERATORS[type(node.op)](evaluate_expression(node.operand))
+    raise ValueError("Unsupported expression")
 
 class Utility(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.rates = load_rates()
+        # (from, to) -> conversion multiplier, cleared whenever self.rates changes
+        self._pair_rates = {}
+        # Joined /currencies field values, rebuilt only after self.rates changes
+        self._currency_fields = None
+        # Last rates payload written by save_rates
+        self._saved_rates = None
         self.start_time = datetime.now()
+        # The cog's own generator for /roll, /random, /choose and /coinflip
+        self.rng = random.Random()
+        # (guild_count, user_count, channel_count) and the monotonic time it was counted
+        self._guild_totals = None
+        self._guild_totals_at = 0.0
+        # (cpu_percent, virtual_memory) and the monotonic time it was read
+        self._system_stats = None
+        self._system_stats_at = 0.0
+    
+    async def cog_app_command_error(self, interaction, error):
+        if isinstance(error, app_commands.MissingPermissions) and not interaction.response.is_done():
+            await interaction.response.send_message("❌ You need administrator permissions to use this command", ephemeral=True)
+    
+    def invalidate_rate_caches(self):
+        """Drop everything derived from self.rates; call after changing it"""
+        self._pair_rates.clear()
+        self._currency_fields = None
+    
+    def get_guild_totals(self):
+        """Count guilds, users and channels, reusing the last count for STATS_CACHE_TTL seconds"""
+        now = time.monotonic()
+        if self._guild_totals is None or now - self._guild_totals_at >= STATS_CACHE_TTL:
+            guilds = self.bot.guilds
+            user_count = channel_count = 0
+            # One pass over the guilds for both totals
+            for guild in guilds:
+                # member_count is None for guilds whose GUILD_CREATE hasn't arrived yet
+                user_count += guild.member_count or 0
+                channel_count += len(guild.channels)
+            guild_count = len(guilds)
+            self._guild_totals = (guild_count, user_count, channel_count)
+            self._guild_totals_at = now
+        return self._guild_totals
+    
+    def get_system_stats(self):
+        """Read CPU and memory usage, reusing the last reading for SYSTEM_STATS_TTL seconds"""
+        now = time.monotonic()
+        if self._system_stats is None or now - self._system_stats_at >= SYSTEM_STATS_TTL:
+            self._system_stats = (psutil.cpu_percent(interval=None), psutil.virtual_memory())
+            self._system_stats_at = now
+        return self._system_stats
     
     @app_commands.command(name="ping", description="Check the bot's latency")
     async def ping(self, interaction: discord.Interaction):
@@ -117,16 +236,13 @@ class Utility(commands.Cog):
         uptime_str = f"{days}d {hours}h {minutes}m {seconds}s"
         
         # Get system info
-        cpu_usage = psutil.cpu_percent()
-        memory = psutil.virtual_memory()
+        cpu_usage, memory = self.get_system_stats()
         memory_usage = memory.percent
         memory_used = memory.used / (1024 ** 2)  # Convert to MB
         memory_total = memory.total / (1024 ** 2)  # Convert to MB
         
         # Get bot info
-        guild_count = len(self.bot.guilds)
-        user_count = sum(guild.member_count for guild in self.bot.guilds)
-        channel_count = sum(len(guild.channels) for guild in self.bot.guilds)
+        guild_count, user_count, channel_count = self.get_guild_totals()
         command_count = len(self.bot.tree.get_commands())
         
         # Create embed
@@ -162,14 +278,14 @@ class Utility(commands.Cog):
         await interaction.response.defer()
         
         # Sanitize the expression to prevent code execution
-        sanitized = re.sub(r'[^0-9+\-*/().%^ ]', '', expression)
+        sanitized = expression.encode('ascii', 'ignore').translate(None, CALCULATE_DELETE).decode('ascii')
         
         # Replace ^ with ** for exponentiation
         sanitized = sanitized.replace('^', '**')
         
         try:
             # Evaluate the expression
-            result = eval(sanitized, {"__builtins__": {}}, {"math": math})
+            result = evaluate_expression(parse_expression(sanitized))
             
             # Create embed
             embed = discord.Embed(
@@ -191,7 +307,7 @@ class Utility(commands.Cog):
         await interaction.response.defer()
         
         # Parse dice notation
-        match = re.match(r'^(\d+)d(\d+)$', dice.lower())
+        match = DICE_RE.match(dice.lower())
         if not match:
             await interaction.followup.send("Invalid dice notation. Use format like `2d6` or `1d20`.")
             return
@@ -213,7 +329,7 @@ class Utility(commands.Cog):
             return
         
         # Roll the dice
-        rolls = [random.randint(1, num_sides) for _ in range(num_dice)]
+        rolls = self.rng.choices(range(1, num_sides + 1), k=num_dice)
         total = sum(rolls)
         
         # Create embed
@@ -249,11 +365,12 @@ class Utility(commands.Cog):
             if to_currency not in self.rates:
                 raise ValueError(f"Currency '{to_currency}' not found in exchange rates")
             
-            # Convert to USD first (our base currency)
-            amount_in_usd = amount / self.rates[from_currency]
-            
-            # Convert from USD to target currency
-            result = amount_in_usd * self.rates[to_currency]
+            # Rates are relative to USD, so the pair rate is the ratio of the two
+            pair = (from_currency, to_currency)
+            rate = self._pair_rates.get(pair)
+            if rate is None:
+                rate = self._pair_rates[pair] = self.rates[to_currency] / self.rates[from_currency]
+            result = amount * rate
             
             # Create embed
             embed = discord.Embed(
@@ -264,7 +381,6 @@ class Utility(commands.Cog):
             )
             
             # Add exchange rate info
-            rate = self.rates[to_currency] / self.rates[from_currency]
             embed.add_field(name="Exchange Rate", value=f"1 {from_currency} = {rate:,.4f} {to_currency}", inline=False)
             
             # Add note about rates
@@ -290,16 +406,19 @@ class Utility(commands.Cog):
             color=discord.Color.blue()
         )
         
-        # Sort currencies alphabetically
-        currencies = sorted(self.rates.keys())
-        
-        # Split currencies into multiple fields (Discord has a limit of 25 fields)
-        chunks = [currencies[i:i+15] for i in range(0, len(currencies), 15)]
+        if self._currency_fields is None:
+            # Sort currencies alphabetically
+            currencies = sorted(self.rates)
+            
+            # Split currencies into multiple fields (Discord has a limit of 25 fields)
+            self._currency_fields = [
+                "\n".join(currencies[i:i+15]) for i in range(0, len(currencies), 15)
+            ]
         
-        for i, chunk in enumerate(chunks):
+        for i, value in enumerate(self._currency_fields):
             embed.add_field(
                 name=f"Currencies {i+1}",
-                value="\n".join(chunk),
+                value=value,
                 inline=True
             )
         
@@ -307,104 +426,64 @@ class Utility(commands.Cog):
         
         await interaction.followup.send(embed=embed)
     
-    @app_commands.command(name="update_rate", description="Update an exchange rate (Admin only)")
+    @app_commands.command(name="currency", description="Add, update or remove a currency (Admin only)")
+    @app_commands.default_permissions(administrator=True)
+    @app_commands.checks.has_permissions(administrator=True)
     @app_commands.describe(
-        currency="Currency code to update (e.g., USD, EUR, GBP)",
-        rate="New exchange rate relative to USD (1 USD = X Currency)"
+        action="Whether to add, update or remove the currency",
+        currency="Currency code (e.g., USD, EUR, GBP)",
+        rate="Exchange rate relative to USD (1 USD = X Currency); required to add or update"
     )
-    async def update_rate(self, interaction: discord.Interaction, currency: str, rate: float):
-        """Update an exchange rate (Admin only)"""
-        # Check if user has admin permissions
-        if not interaction.user.guild_permissions.administrator:
-            await interaction.response.send_message("❌ You need administrator permissions to use this command", ephemeral=True)
-            return
-        
+    async def currency(
+        self,
+        interaction: discord.Interaction,
+        action: Literal["add", "update", "remove"],
+        currency: str,
+        rate: Optional[float] = None
+    ):
+        """Add, update or remove a currency (Admin only)"""
         await interaction.response.defer(ephemeral=True)
         
         try:
             # Normalize currency code
             currency = currency.upper()
             
-            # Update rate
-            old_rate = self.rates.get(currency, None)
-            self.rates[currency] = rate
-            save_rates(self.rates)
-            
-            if old_rate:
-                await interaction.followup.send(f"✅ Updated exchange rate for {currency}: {old_rate} → {rate}", ephemeral=True)
+            if action == "remove":
+                # Check if currency exists
+                if currency not in self.rates:
+                    await interaction.followup.send(f"❌ Currency {currency} not found", ephemeral=True)
+                    return
+                
+                # Prevent removing USD (base currency)
+                if currency == "USD":
+                    await interaction.followup.send("❌ Cannot remove USD as it is the base currency", ephemeral=True)
+                    return
+                
+                del self.rates[currency]
+                message = f"✅ Removed currency {currency}"
             else:
-                await interaction.followup.send(f"✅ Added new currency {currency} with rate {rate}", ephemeral=True)
+                if rate is None:
+                    await interaction.followup.send(f"❌ A rate is required to {action} a currency", ephemeral=True)
+                    return
                 
-        except Exception as e:
-            logger.error(f"Error in update_rate command: {str(e)}")
-            await interaction.followup.send(f"❌ An error occurred: {str(e)}", ephemeral=True)
-    
-    @app_commands.command(name="add_currency", description="Add a new currency (Admin only)")
-    @app_commands.describe(
-        currency="Currency code to add (e.g., USD, EUR, GBP)",
-        rate="Exchange rate relative to USD (1 USD = X Currency)"
-    )
-    async def add_currency(self, interaction: discord.Interaction, currency: str, rate: float):
-        """Add a new currency (Admin only)"""
-        # Check if user has admin permissions
-        if not interaction.user.guild_permissions.administrator:
-            await interaction.response.send_message("❌ You need administrator permissions to use this command", ephemeral=True)
-            return
-        
-        await interaction.response.defer(ephemeral=True)
-        
-        try:
-            # Normalize currency code
-            currency = currency.upper()
-            
-            # Check if currency already exists
-            if currency in self.rates:
-                await interaction.followup.send(f"❌ Currency {currency} already exists. Use /update_rate to update it.", ephemeral=True)
-                return
-            
-            # Add new currency
-            self.rates[currency] = rate
-            save_rates(self.rates)
-            
-            await interaction.followup.send(f"✅ Added new currency {currency} with rate {rate}", ephemeral=True)
+                old_rate = self.rates.get(currency)
+                if action == "add" and old_rate is not None:
+                    await interaction.followup.send(f"❌ Currency {currency} already exists. Use `/currency update` to update it.", ephemeral=True)
+                    return
                 
-        except Exception as e:
-            logger.error(f"Error in add_currency command: {str(e)}")
-            await interaction.followup.send(f"❌ An error occurred: {str(e)}", ephemeral=True)
-    
-    @app_commands.command(name="remove_currency", description="Remove a currency (Admin only)")
-    @app_commands.describe(currency="Currency code to remove (e.g., EUR, GBP)")
-    async def remove_currency(self, interaction: discord.Interaction, currency: str):
-        """Remove a currency (Admin only)"""
-        # Check if user has admin permissions
-        if not interaction.user.guild_permissions.administrator:
-            await interaction.response.send_message("❌ You need administrator permissions to use this command", ephemeral=True)
-            return
-        
-        await interaction.response.defer(ephemeral=True)
-        
-        try:
-            # Normalize currency code
-            currency = currency.upper()
+                self.rates[currency] = rate
+                if old_rate is not None:
+                    message = f"✅ Updated exchange rate for {currency}: {old_rate} → {rate}"
+                else:
+                    message = f"✅ Added new currency {currency} with rate {rate}"
             
-            # Check if currency exists
-            if currency not in self.rates:
-                await interaction.followup.send(f"❌ Currency {currency} not found", ephemeral=True)
-                return
-            
-            # Prevent removing USD (base currency)
-            if currency == "USD":
-                await interaction.followup.send("❌ Cannot remove USD as it is the base currency", ephemeral=True)
-                return
-            
-            # Remove currency
-            del self.rates[currency]
-            save_rates(self.rates)
+            self.invalidate_rate_caches()
+            self._saved_rates = await save_rates(self.rates, self._saved_rates)
             
-            await interaction.followup.send(f"✅ Removed currency {currency}", ephemeral=True)
+            await interaction.followup.send(message, ephemeral=True)
                 
         except Exception as e:
-            logger.error(f"Error in remove_currency command: {str(e)}")
+            logger.error(f"Error in currency command: {str(e)}")
             await interaction.followup.send(f"❌ An error occurred: {str(e)}", ephemeral=True)
     
     @app_commands.command(name="random", description="Generate a random number")
@@ -423,7 +502,7 @@ class Utility(commands.Cog):
                 return
             
             # Generate random number
-            result = random.randint(min_value, max_value)
+            result = self.rng.randint(min_value, max_value)
             
             # Create embed
             embed = discord.Embed(
@@ -456,7 +535,7 @@ class Utility(commands.Cog):
             return
         
         # Choose a random option
-        chosen = random.choice(option_list)
+        chosen = self.rng.choice(option_list)
         
         # Create embed
         embed = discord.Embed(
@@ -476,7 +555,7 @@ class Utility(commands.Cog):
         await interaction.response.defer()
         
         # Flip the coin
-        result = random.choice(["Heads", "Tails"])
+        result = self.rng.choice(["Heads", "Tails"])
         
         # Create embed
         embed = discord.Embed(
@@ -496,22 +575,15 @@ class Utility(commands.Cog):
         await interaction.followup.send(embed=embed)
 
     @app_commands.command(name="announce", description="Send an announcement to the configured channel (from config), pinging the configured role.")
+    @app_commands.default_permissions(administrator=True)
+    @app_commands.checks.has_permissions(administrator=True)
     @app_commands.describe(subject="The subject/title of the announcement", content="The announcement content")
     async def announce(self, interaction: discord.Interaction, subject: str, content: str):
         """
         Admin-only command to send an announcement embed to the configured channel (from config), pinging the configured role.
         """
-        # Check admin permissions
-        if not interaction.user.guild_permissions.administrator:
-            await interaction.response.send_message("You need administrator permissions to use this command!", ephemeral=True)
-            return
         # Load config
-        try:
-            with open('data/config.json', 'r') as f:
-                config = json.load(f)
-        except Exception:
-            await interaction.response.send_message("Config file not found or invalid.", ephemeral=True)
-            return
+        config = load_data('config')
         channel_id = config.get("announce_channel_id")
         role_id = config.get("announce_role_id")
         if not channel_id or not role_id or not str(channel_id).isdigit() or not str(role_id).isdigit():
@@ -1,69 +1,115 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-import json
-from datetime import datetime
+import asyncio
+import logging
+import time
+from bot import load_data, save_data
 
-def load_data(file):
-    with open(f'data/{file}.json', 'r') as f:
-        return json.load(f)
+logger = logging.getLogger('bot.welcome')
 
-def save_data(file, data):
-    with open(f'data/{file}.json', 'w') as f:
-        json.dump(data, f, indent=4)
+# Discord allows 2 channel renames per 10 minutes, so rename at most once per 5 minutes
+RENAME_INTERVAL = 5 * 60
 
 class Welcome(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        # channel_id -> pending rename task, and when each channel was last renamed
+        self._pending_renames = {}
+        self._last_renamed = {}
+        # Channel ID strings from config -> int, so each stored ID is parsed once
+        self._channel_ids = {}
+
+    def cog_unload(self):
+        for task in self._pending_renames.values():
+            task.cancel()
+
+    async def cog_app_command_error(self, interaction, error):
+        if isinstance(error, app_commands.MissingPermissions) and not interaction.response.is_done():
+            await interaction.response.send_message("You need administrator permissions to use this command!", ephemeral=True)
+
+    def get_config_channel(self, config, key):
+        """Look up the channel whose ID is stored under key in config, or None if unset or missing"""
+        raw_id = config.get(key)
+        if not raw_id:
+            return None
+        channel_id = self._channel_ids.get(raw_id)
+        if channel_id is None:
+            channel_id = self._channel_ids[raw_id] = int(raw_id)
+        return self.bot.get_channel(channel_id)
+
+    def schedule_rename(self, channel):
+        """Rename the channel to the member count, coalescing bursts of joins and leaves into one edit"""
+        if channel.id not in self._pending_renames:
+            self._pending_renames[channel.id] = asyncio.create_task(self._rename_later(channel))
+
+    async def _rename_later(self, channel):
+        try:
+            last = self._last_renamed.get(channel.id)
+            if last is not None:
+                await asyncio.sleep(max(0, last + RENAME_INTERVAL - time.monotonic()))
+            # Read the count only now, so the name reflects every join and leave while waiting
+            name = f"《👋》{channel.guild.member_count}"
+            # A join and a leave can cancel out; don't spend a rename on an unchanged name
+            if channel.name != name:
+                await channel.edit(name=name)
+                self._last_renamed[channel.id] = time.monotonic()
+        except Exception as e:
+            logger.warning("Failed to update channel name for %s: %s", channel.id, e)
+        finally:
+            self._pending_renames.pop(channel.id, None)
 
     @commands.Cog.listener()
     async def on_member_join(self, member):
         config = load_data('config')
-        for role_id in config.get("auto_roles", []):
-            role = member.guild.get_role(int(role_id))
-            if role:
-                try:
-                    await member.add_roles(role, reason="Auto-role assignment")
-                except discord.HTTPException:
-                    pass
-        if config.get("welcome_channel"):
-            channel = self.bot.get_channel(int(config["welcome_channel"]))
+        auto_roles = config.get("auto_roles")
+        welcome_channel_id = config.get("welcome_channel")
+        # Nothing to do for this join
+        if not auto_roles and not welcome_channel_id:
+            return
+        guild = member.guild
+        # Add every auto-role in one request instead of one per role
+        roles = [role for role in (guild.get_role(int(role_id)) for role_id in auto_roles or ()) if role]
+        if roles:
+            try:
+                await member.add_roles(*roles, reason="Auto-role assignment")
+            except discord.HTTPException:
+                pass
+        if welcome_channel_id:
+            channel = self.get_config_channel(config, "welcome_channel")
             if channel:
-                try:
-                    await channel.edit(name=f"《👋》{member.guild.member_count}")
-                except Exception as e:
-                    print(f"Failed to update channel name: {e}")
+                self.schedule_rename(channel)
                 embed = discord.Embed(
-                    title=f"Welcome to {member.guild.name}!",
-                    description=f"Welcome to the server! We're now at **{member.guild.member_count}** members!",
-                    color=discord.Color.green()
+                    title=f"Welcome to {guild.name}!",
+                    description=f"Welcome to the server! We're now at **{guild.member_count}** members!",
+                    color=discord.Color.green(),
+                    timestamp=discord.utils.utcnow()
                 )
                 embed.set_thumbnail(url=member.display_avatar.url)
-                embed.set_footer(text=f"Joined at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+                embed.set_footer(text="Joined")
                 await channel.send(f"Hey {member.mention}!", embed=embed)
 
     @commands.Cog.listener()
     async def on_member_boost(self, member, boost_type):
+        guild = member.guild
         config = load_data('config')
-        if not config.get('boost_channel_id'):
-            return
-        channel = self.bot.get_channel(int(config['boost_channel_id']))
+        channel = self.get_config_channel(config, 'boost_channel_id')
         if not channel:
             return
         embed = discord.Embed(
             title="✨ Server Boosted! ✨",
             description=(
-                f"Thank you {member.mention} for boosting **{member.guild.name}**!\n\n"
+                f"Thank you {member.mention} for boosting **{guild.name}**!\n\n"
                 "Your support helps us keep the community running and growing. "
                 "As a token of our appreciation, you've received the **Booster** role! 🎉"
             ),
             color=0xFF73FA
         )
-        if member.guild.icon:
-            embed.set_thumbnail(url=member.guild.icon.url)
-        if hasattr(member.guild, 'premium_subscription_count'):
-            boost_count = member.guild.premium_subscription_count
-            boost_level = member.guild.premium_tier
+        if guild.icon:
+            embed.set_thumbnail(url=guild.icon.url)
+        if hasattr(guild, 'premium_subscription_count'):
+            boost_count = guild.premium_subscription_count
+            boost_level = guild.premium_tier
             level_str = {
                 0: "Level 0",
                 1: "Level 1 (5+ boosts)",
@@ -80,69 +126,63 @@ class Welcome(commands.Cog):
 
     @commands.Cog.listener()
     async def on_member_remove(self, member):
+        guild = member.guild
         config = load_data('config')
-        if config.get("goodbye_channel"):
-            channel = self.bot.get_channel(int(config["goodbye_channel"]))
-            if channel:
-                try:
-                    await channel.edit(name=f"《👋》{member.guild.member_count}")
-                except Exception as e:
-                    print(f"Failed to update channel name: {e}")
-                embed = discord.Embed(
-                    title=f"Goodbye!",
-                    description=f"{member.name} has left the server. We're now at **{member.guild.member_count}** members.",
-                    color=discord.Color.red()
-                )
-                embed.set_footer(text=f"Left at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-                await channel.send(embed=embed)
+        channel = self.get_config_channel(config, "goodbye_channel")
+        if channel:
+            self.schedule_rename(channel)
+            embed = discord.Embed(
+                title=f"Goodbye!",
+                description=f"{member.name} has left the server. We're now at **{guild.member_count}** members.",
+                color=discord.Color.red(),
+                timestamp=discord.utils.utcnow()
+            )
+            embed.set_footer(text="Left")
+            await channel.send(embed=embed)
 
     @app_commands.command(name="set_welcome_channel", description="Set the welcome message channel")
+    @app_commands.default_permissions(administrator=True)
+    @app_commands.checks.has_permissions(administrator=True)
     @app_commands.describe(channel="The channel for welcome messages")
     async def set_welcome_channel(self, interaction, channel: discord.TextChannel):
-        if not interaction.user.guild_permissions.administrator:
-            await interaction.response.send_message("You need administrator permissions to use this command!",
-                                                    ephemeral=True)
-            return
         config = load_data('config')
         config["welcome_channel"] = str(channel.id)
-        save_data('config', config)
+        await asyncio.to_thread(save_data, 'config', config)
         await interaction.response.send_message(f"Welcome channel set to {channel.mention}!", ephemeral=True)
 
     @app_commands.command(name="set_goodbye_channel", description="Set the goodbye message channel")
+    @app_commands.default_permissions(administrator=True)
+    @app_commands.checks.has_permissions(administrator=True)
     @app_commands.describe(channel="The channel for goodbye messages")
     async def set_goodbye_channel(self, interaction, channel: discord.TextChannel):
-        if not interaction.user.guild_permissions.administrator:
-            await interaction.response.send_message("You need administrator permissions to use this command!",
-                                                    ephemeral=True)
-            return
         config = load_data('config')
         config["goodbye_channel"] = str(channel.id)
-        save_data('config', config)
+        await asyncio.to_thread(save_data, 'config', config)
         await interaction.response.send_message(f"Goodbye channel set to {channel.mention}!", ephemeral=True)
 
     @app_commands.command(name="welcome_test", description="Test the welcome message")
+    @app_commands.default_permissions(administrator=True)
+    @app_commands.checks.has_permissions(administrator=True)
     async def welcome_test(self, interaction):
-        if not interaction.user.guild_permissions.administrator:
-            await interaction.response.send_message("You need administrator permissions to use this command!",
-                                                    ephemeral=True)
-            return
         config = load_data('config')
         if not config.get("welcome_channel"):
             await interaction.response.send_message("Welcome channel is not set! Use `/set_welcome_channel` first.",
                                                     ephemeral=True)
             return
-        channel = self.bot.get_channel(int(config["welcome_channel"]))
+        channel = self.get_config_channel(config, "welcome_channel")
         if not channel:
             await interaction.response.send_message("Welcome channel not found! It may have been deleted.",
                                                     ephemeral=True)
             return
+        guild = interaction.guild
         embed = discord.Embed(
-            title=f"Welcome to {interaction.guild.name}!",
-            description=f"Hey {interaction.user.mention}, welcome to the server! We're now at **{interaction.guild.member_count}** members!",
-            color=discord.Color.green()
+            title=f"Welcome to {guild.name}!",
+            description=f"Hey {interaction.user.mention}, welcome to the server! We're now at **{guild.member_count}** members!",
+            color=discord.Color.green(),
+            timestamp=discord.utils.utcnow()
         )
         embed.set_thumbnail(url=interaction.user.display_avatar.url)
-        embed.set_footer(text=f"This is a test message | {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        embed.set_footer(text="This is a test message")
         await channel.send(embed=embed)
         await interaction.response.send_message(f"Test welcome message sent to {channel.mention}!", ephemeral=True)
 